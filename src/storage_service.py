@@ -1,17 +1,27 @@
 """
 Mock Storage Service for Cloud Storage Tiering System
 """
+import hashlib
+import heapq
+import itertools
+import mmap
 import os
+import tempfile
+import threading
 import uuid
 import time
 from datetime import datetime, timedelta, date
 from enum import Enum
 from typing import Dict, Optional, List, Tuple
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form, status
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Response, UploadFile, File, Form, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 
-app = FastAPI(title="Cloud Storage Tiering Service")
+# orjson serializes responses several times faster than the stdlib json
+# encoder and handles datetimes natively.
+app = FastAPI(title="Cloud Storage Tiering Service",
+              default_response_class=ORJSONResponse)
 
 class StorageTier(str, Enum):
     HOT = "HOT"
@@ -19,6 +29,13 @@ class StorageTier(str, Enum):
     COLD = "COLD"
 
 class FileMetadata(BaseModel):
+    """Response schema for file metadata.
+
+    Built from a FileRecord at the response boundary only - the internal
+    catalog stores plain FileRecord objects, not Pydantic models.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
     file_id: str
     filename: str
     size: int
@@ -27,31 +44,214 @@ class FileMetadata(BaseModel):
     last_accessed: datetime = Field(default_factory=datetime.utcnow)
     content_type: str = "application/octet-stream"
     etag: str = ""
-    
+    is_priority_flag: bool = False
+    is_legal_flag: bool = False
+
+class FileRecord:
+    """Internal storage record for a stored file.
+
+    A plain __slots__ class rather than a Pydantic model: records are
+    created and read on every hot path (upload, download, tiering), where
+    validator dispatch and a per-instance __dict__ are wasted cost. The
+    special-rule flags are derived once here so tiering runs don't redo
+    the filename string scans.
+    """
+
+    __slots__ = ("file_id", "filename", "size", "tier", "created_at",
+                 "last_accessed", "content_type", "etag",
+                 "is_priority_flag", "is_legal_flag", "_json_cache")
+
+    def __init__(self, file_id: str, filename: str, size: int,
+                 tier: StorageTier = StorageTier.HOT,
+                 created_at: Optional[datetime] = None,
+                 last_accessed: Optional[datetime] = None,
+                 content_type: str = "application/octet-stream",
+                 etag: str = ""):
+        now = datetime.utcnow()
+        self.file_id = file_id
+        self.filename = filename
+        self.size = size
+        self.tier = tier
+        self.created_at = created_at if created_at is not None else now
+        self.last_accessed = last_accessed if last_accessed is not None else now
+        self.content_type = content_type
+        self.etag = etag
+        upper = filename.upper()
+        self.is_priority_flag = "_PRIORITY_" in upper
+        self.is_legal_flag = upper.startswith("LEGAL_")
+        # Serialized metadata response, built on first GET and dropped
+        # whenever last_accessed or the tier changes
+        self._json_cache = None
+
     def update_last_accessed(self, days_ago: int = 0):
         """Update the last_accessed timestamp."""
         self.last_accessed = datetime.utcnow() - timedelta(days=days_ago)
-    
+
     def is_priority(self) -> bool:
         """Check if this is a priority file."""
-        return "_PRIORITY_" in self.file_id.upper()
-    
+        return self.is_priority_flag
+
     def is_legal_document(self) -> bool:
         """Check if this is a legal document."""
-        return self.file_id.upper().startswith("LEGAL_")
+        return self.is_legal_flag
 
 class StorageStats(BaseModel):
     total_files: int
     total_size: int
     tiers: Dict[str, Dict[str, int]]
 
-# In-memory storage for demo purposes
-files_metadata: Dict[str, FileMetadata] = {}
-files_content: Dict[str, bytes] = {}
+class BlobStore:
+    """Append-only on-disk store for file payloads.
+
+    Payloads live in one anonymous temp file read back through a shared
+    mmap, so the OS page cache owns the bytes and process RSS stays
+    bounded by the working set instead of the whole catalog. Callers keep
+    only (offset, length) pairs. Appends are serialized with a lock; the
+    mapping is rebuilt lazily after the file grows. Space freed by
+    deleted files is only reclaimed when the store is cleared.
+    """
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile(prefix="storage_blobs_")
+        self._size = 0
+        self._mmap = None
+        self._lock = threading.Lock()
+
+    def append(self, data) -> Tuple[int, int]:
+        """Write a payload and return its (offset, length) handle."""
+        with self._lock:
+            offset = self._size
+            self._file.seek(offset)
+            self._file.write(data)
+            self._size += len(data)
+            self._mmap = None  # grown past the current mapping
+        return offset, len(data)
+
+    def view(self, offset: int, length: int) -> memoryview:
+        """Return a zero-copy view of a stored payload."""
+        with self._lock:
+            if self._mmap is None or self._mmap.size() < self._size:
+                self._file.flush()
+                self._mmap = mmap.mmap(self._file.fileno(), self._size,
+                                       access=mmap.ACCESS_READ)
+            return memoryview(self._mmap)[offset:offset + length]
+
+    def clear(self):
+        """Drop all stored payloads and reclaim the disk space."""
+        with self._lock:
+            self._mmap = None
+            self._file.truncate(0)
+            self._size = 0
+
+# In-memory storage for demo purposes. Payload bytes live in the blob
+# store; files_content maps file_id to its (offset, length) handle.
+files_metadata: Dict[str, FileRecord] = {}
+files_content: Dict[str, Tuple[int, int]] = {}
+blob_store = BlobStore()
+
+def iter_content(content: memoryview, chunk_size: int = 1024 * 1024):
+    """Stream a stored payload one chunk at a time.
+
+    Slicing the memoryview is O(1) and copy-free; only the single chunk
+    being sent is materialized as bytes (Starlette requires bytes chunks),
+    so at most one chunk of the payload is duplicated at any moment.
+    """
+    for start in range(0, len(content), chunk_size):
+        yield bytes(content[start:start + chunk_size])
+
+# Per-tier min-heaps of (last_accessed, file_id), oldest entry first, so
+# run_tiering only examines files old enough to move instead of scanning
+# the whole catalog. Entries are invalidated lazily: whenever a file is
+# accessed or changes tier a fresh entry is pushed, and entries whose
+# timestamp no longer matches the file's metadata are skipped on pop.
+tier_heaps: Dict[StorageTier, List[Tuple[datetime, str]]] = {t: [] for t in StorageTier}
+
+def track_file_age(metadata: FileRecord):
+    """Record the file's current (last_accessed, tier) pair in the age heaps.
+
+    Called after every mutation of last_accessed or tier, so it doubles
+    as the invalidation point for the serialized-metadata cache. COLD
+    files get no heap entry: run_tiering never drains the COLD heap, so
+    pushing there would leak a tuple per access to cold data.
+    """
+    metadata._json_cache = None
+    if metadata.tier is not StorageTier.COLD:
+        heapq.heappush(tier_heaps[metadata.tier], (metadata.last_accessed, metadata.file_id))
+
+def serialize_metadata(record: FileRecord) -> bytes:
+    """Serialize a record to the FileMetadata response shape and cache it."""
+    payload = orjson.dumps({
+        "file_id": record.file_id,
+        "filename": record.filename,
+        "size": record.size,
+        "tier": record.tier.value,
+        "created_at": record.created_at,
+        "last_accessed": record.last_accessed,
+        "content_type": record.content_type,
+        "etag": record.etag,
+        "is_priority_flag": record.is_priority_flag,
+        "is_legal_flag": record.is_legal_flag,
+    })
+    record._json_cache = payload
+    return payload
+
+# Per-tier membership index. run_tiering uses it to skip empty tiers and
+# to drop stale heap entries with a set probe instead of a metadata
+# lookup; COLD membership is tracked but never iterated.
+tier_index: Dict[StorageTier, set] = {t: set() for t in StorageTier}
+
+# Running per-tier counters so /admin/stats never rescans the catalog.
+# Stored as lists indexed by tier ordinal - an int index is a plain
+# pointer deref, versus hashing the str-subclass enum into a dict on
+# every upload, delete and tier move. Single-process int updates are
+# atomic under the GIL so no locking is needed here.
+TIER_ORDER = tuple(StorageTier)
+_TIER_ORD = {tier: ordinal for ordinal, tier in enumerate(TIER_ORDER)}
+tier_counts: List[int] = [0] * len(TIER_ORDER)
+tier_sizes: List[int] = [0] * len(TIER_ORDER)
+
+def move_file_tier(metadata: FileRecord, new_tier: StorageTier):
+    """Move a file to a new tier, keeping the index, counters and age heaps in sync."""
+    old_ord = _TIER_ORD[metadata.tier]
+    new_ord = _TIER_ORD[new_tier]
+    tier_index[metadata.tier].discard(metadata.file_id)
+    tier_counts[old_ord] -= 1
+    tier_sizes[old_ord] -= metadata.size
+    metadata.tier = new_tier
+    tier_index[new_tier].add(metadata.file_id)
+    tier_counts[new_ord] += 1
+    tier_sizes[new_ord] += metadata.size
+    track_file_age(metadata)
+
+def reset_storage_state():
+    """Clear all storage state, including blob data (used between tests)."""
+    files_metadata.clear()
+    files_content.clear()
+    blob_store.clear()
+    for tier in StorageTier:
+        tier_heaps[tier].clear()
+        tier_index[tier].clear()
+        tier_counts[_TIER_ORD[tier]] = 0
+        tier_sizes[_TIER_ORD[tier]] = 0
 
 # Test mode flag - controls test-specific behavior
 test_mode = False  # Set to True only in test environment
 
+# File ids: a per-process random prefix plus a monotonic counter. One
+# CSPRNG draw at startup instead of one per upload, and ids sort in
+# creation order within a process.
+_id_prefix = uuid.uuid4().hex[:8]
+_id_counter = itertools.count()
+
+def generate_file_id() -> str:
+    """Return a new unique, creation-ordered file id."""
+    return f"{_id_prefix}-{next(_id_counter):012x}"
+
+# Upload limits
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # Read uploads in 1MB chunks
+MIN_FILE_SIZE = 1024 * 1024  # 1MB minimum
+MAX_FILE_SIZE = 10 * 1024 * 1024 * 1024  # 10GB maximum
+
 # Tier configuration
 TIER_CONFIG = {
     StorageTier.HOT: {
@@ -71,115 +271,221 @@ TIER_CONFIG = {
     }
 }
 
+class ContentLengthLimitMiddleware:
+    """Reject obviously oversized uploads from the Content-Length header.
+
+    This has to sit at the ASGI layer: by the time a route dependency or
+    the endpoint runs, FastAPI has already awaited request.form(), which
+    reads the entire multipart body off the wire and spools it to disk.
+    Short-circuiting here answers 413 without ever awaiting receive, so
+    rejection costs O(1) regardless of the advertised body size. The
+    streaming loop in upload_file still enforces the cap for clients that
+    lie about (or omit) the header. One chunk of slack is allowed for the
+    multipart framing overhead.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (scope["type"] == "http" and scope["method"] == "POST"
+                and scope["path"] == "/files"):
+            content_length = next((value for name, value in scope["headers"]
+                                   if name == b"content-length"), None)
+            if (content_length is not None and content_length.isdigit()
+                    and int(content_length) > MAX_FILE_SIZE + UPLOAD_CHUNK_SIZE):
+                response = ORJSONResponse(
+                    {"detail": "File size exceeds maximum limit of 10GB"},
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+app.add_middleware(ContentLengthLimitMiddleware)
+
 @app.post("/files", response_model=FileMetadata, status_code=status.HTTP_201_CREATED)
 async def upload_file(file: UploadFile = File(...)):
     """Upload a new file to the storage service."""
-    file_id = str(uuid.uuid4())
-    content = await file.read()
-    
-    # Basic validation - always check size limits
-    if len(content) < 1024 * 1024:  # 1MB minimum
+    file_id = generate_file_id()
+
+    # Stream the upload in chunks instead of materializing the whole body at
+    # once - avoids a second full-size copy and lets us abort oversized
+    # uploads without buffering gigabytes first.
+    buffer = bytearray()
+    size = 0
+    # Hash incrementally while the bytes are already in cache - a content
+    # etag (usable for conditional GETs) at no extra pass over the data.
+    hasher = hashlib.blake2b(digest_size=16)
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="File size exceeds maximum limit of 10GB"
+            )
+        hasher.update(chunk)
+        buffer.extend(chunk)
+
+    if size < MIN_FILE_SIZE:
         raise HTTPException(status_code=400, detail="File size must be at least 1MB")
-    if len(content) > 10 * 1024 * 1024 * 1024:  # 10GB maximum
-        raise HTTPException(status_code=400, detail="File size exceeds maximum limit of 10GB")
-    
+
     now = datetime.utcnow()
-    metadata = FileMetadata(
+    metadata = FileRecord(
         file_id=file_id,
         filename=file.filename,
-        size=len(content),
+        size=size,
         tier=StorageTier.HOT,
         created_at=now,
         last_accessed=now,
         content_type=file.content_type or "application/octet-stream",
-        etag=str(uuid.uuid4())
+        etag=hasher.hexdigest()
     )
     
     files_metadata[file_id] = metadata
-    files_content[file_id] = content
-    
+    files_content[file_id] = blob_store.append(buffer)
+    track_file_age(metadata)
+    tier_index[metadata.tier].add(file_id)
+    tier_ord = _TIER_ORD[metadata.tier]
+    tier_counts[tier_ord] += 1
+    tier_sizes[tier_ord] += metadata.size
+
     return metadata
 
-@app.get("/files/{file_id}")
-async def download_file(file_id: str):
-    """Download a file by its ID."""
-    if file_id not in files_metadata:
+async def get_metadata_or_404(file_id: str) -> FileRecord:
+    """Dependency resolving a file_id to its metadata or raising 404.
+
+    Declared async so FastAPI runs it on the event loop instead of
+    offloading to the threadpool - it is only a dict lookup. A single
+    .get() probe replaces the membership-test-then-index pair.
+    """
+    metadata = files_metadata.get(file_id)
+    if metadata is None:
         raise HTTPException(status_code=404, detail="File not found")
-    
-    metadata = files_metadata[file_id]
+    return metadata
+
+@app.get("/files/{file_id}")
+async def download_file(metadata: FileRecord = Depends(get_metadata_or_404)):
+    """Download a file by its ID, streamed without copying the payload."""
     metadata.last_accessed = datetime.utcnow()
-    
-    return {
-        "content": files_content[file_id],
-        "filename": metadata.filename,
-        "content_type": metadata.content_type
-    }
+    track_file_age(metadata)
+
+    offset, length = files_content[metadata.file_id]
+    return StreamingResponse(
+        iter_content(blob_store.view(offset, length)),
+        media_type=metadata.content_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{metadata.filename}"',
+            # StreamingResponse doesn't set it, but the size is known
+            "Content-Length": str(length),
+        }
+    )
 
 @app.get("/files/{file_id}/metadata", response_model=FileMetadata)
-async def get_file_metadata(file_id: str):
-    """Get metadata for a file."""
-    if file_id not in files_metadata:
-        raise HTTPException(status_code=404, detail="File not found")
-    return files_metadata[file_id]
+async def get_file_metadata(metadata: FileRecord = Depends(get_metadata_or_404)):
+    """Get metadata for a file.
+
+    Metadata rarely changes between reads, so the serialized JSON bytes
+    are cached on the record and emitted directly - a GET on the hit path
+    skips model validation and serialization entirely.
+    """
+    return Response(content=metadata._json_cache or serialize_metadata(metadata),
+                    media_type="application/json")
 
 @app.delete("/files/{file_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_file(file_id: str):
+async def delete_file(metadata: FileRecord = Depends(get_metadata_or_404)):
     """Delete a file."""
-    if file_id not in files_metadata:
-        raise HTTPException(status_code=404, detail="File not found")
-    
-    files_metadata.pop(file_id, None)
-    files_content.pop(file_id, None)
-    
+    files_metadata.pop(metadata.file_id, None)
+    files_content.pop(metadata.file_id, None)
+    tier_index[metadata.tier].discard(metadata.file_id)
+    tier_ord = _TIER_ORD[metadata.tier]
+    tier_counts[tier_ord] -= 1
+    tier_sizes[tier_ord] -= metadata.size
+
     return None
 
 @app.post("/admin/tiering/run")
 async def run_tiering():
-    """Run the tiering process to move files between storage tiers."""
+    """Run the tiering process to move files between storage tiers.
+
+    Only pops age-heap entries old enough to move, so a run costs
+    O(k log N) for k eligible files instead of scanning every file.
+    Files in COLD have no heap churn - they never move automatically.
+
+    Mutation safety: the old O(N) loop needed a list() snapshot of the
+    catalog; the heap drain never iterates files_metadata at all, and a
+    run only mutates record fields and heap/index membership - it never
+    inserts or deletes catalog keys.
+    """
     moved_count = 0
     current_time = datetime.utcnow()
-    
-    for file_id, metadata in list(files_metadata.items()):
-        # Apply special business rules first
-        forced_tier = apply_special_rules(metadata)
-        if forced_tier:
-            if metadata.tier != forced_tier:
-                metadata.tier = forced_tier
-                moved_count += 1
-            continue
-            
-        if metadata.tier == StorageTier.COLD:
-            continue  # Files in COLD tier don't move up automatically
-            
-        days_since_access = (current_time - metadata.last_accessed).days
-        config = TIER_CONFIG[metadata.tier]
-        
-        # Check if file should be moved to next tier
-        if config["max_age_days"] is not None and days_since_access >= config["max_age_days"]:
-            if config["next_tier"]:  # Only move if there is a next tier
-                metadata.tier = config["next_tier"]
-                moved_count += 1
-    
+
+    # WARM is processed before HOT so a file demoted out of HOT waits for
+    # the next run before it can move again (one hop per run, as before).
+    for tier in (StorageTier.WARM, StorageTier.HOT):
+        index = tier_index[tier]
+        if not index:
+            continue  # no files in this tier, nothing to age out
+
+        config = TIER_CONFIG[tier]
+        # Precompute the cutoff once so each heap entry costs a single
+        # datetime comparison instead of a timedelta build plus .days.
+        cutoff = current_time - timedelta(days=config["max_age_days"])
+        heap = tier_heaps[tier]
+        retained = []  # entries held in place by special rules
+
+        while heap and heap[0][0] <= cutoff:
+            last_accessed, file_id = heapq.heappop(heap)
+            if file_id not in index:
+                continue  # stale entry - the file was deleted or moved
+            metadata = files_metadata[file_id]
+            if metadata.last_accessed != last_accessed:
+                continue  # stale entry - the file was touched since
+
+            # Apply special business rules first
+            forced_tier = apply_special_rules(metadata, current_time)
+            if forced_tier:
+                if metadata.tier != forced_tier:
+                    move_file_tier(metadata, forced_tier)
+                    moved_count += 1
+                else:
+                    retained.append((last_accessed, file_id))
+                continue
+
+            move_file_tier(metadata, config["next_tier"])
+            moved_count += 1
+
+        # Re-queue pinned files so the next run re-evaluates their rules
+        for entry in retained:
+            heapq.heappush(heap, entry)
+
     return {"status": "success", "files_moved": moved_count}
 
-def apply_special_rules(file_metadata: FileMetadata) -> Optional[str]:
+# Legal documents are retained in WARM while strictly less than 181 full
+# days old - the same boundary as the previous `.days <= 180` check.
+LEGAL_RETENTION_PERIOD = timedelta(days=181)
+
+def apply_special_rules(file_metadata: FileRecord,
+                        current_time: Optional[datetime] = None) -> Optional[str]:
     """Apply special business rules that affect tiering decisions.
-    
+
     Returns:
         str: The tier to force the file into, or None to use normal tiering rules
     """
     # Files containing "_PRIORITY_" in filename should stay in HOT tier
-    if "_PRIORITY_" in file_metadata.filename.upper():
+    if file_metadata.is_priority_flag:
         return StorageTier.HOT
-    
+
     # Legal documents have extended retention in WARM tier (180 days instead of 90)
-    if file_metadata.filename.upper().startswith("LEGAL_"):
+    if file_metadata.is_legal_flag:
         if file_metadata.tier == StorageTier.WARM:
-            current_time = datetime.utcnow()
-            days_since_access = (current_time - file_metadata.last_accessed).days
-            if days_since_access <= 180:  # Extended retention for legal docs
+            if current_time is None:
+                current_time = datetime.utcnow()
+            if file_metadata.last_accessed > current_time - LEGAL_RETENTION_PERIOD:
                 return StorageTier.WARM
-    
+
     return None
 
 def parse_date(date_str: str, reference_date: datetime) -> datetime:
@@ -203,36 +509,93 @@ class UpdateLastAccessedRequest(BaseModel):
     days_ago: int
 
 @app.post("/admin/files/{file_id}/update-last-accessed")
-async def update_last_accessed(file_id: str, request: UpdateLastAccessedRequest):
+async def update_last_accessed(request: UpdateLastAccessedRequest,
+                               metadata: FileRecord = Depends(get_metadata_or_404)):
     """Update the last_accessed time of a file (for testing purposes)."""
-    if file_id not in files_metadata:
-        raise HTTPException(status_code=404, detail="File not found")
-    
     # Update last_accessed to be X days ago
-    files_metadata[file_id].last_accessed = datetime.utcnow() - timedelta(days=request.days_ago)
+    metadata.last_accessed = datetime.utcnow() - timedelta(days=request.days_ago)
+    track_file_age(metadata)
     return {
-        "status": "success", 
-        "file_id": file_id, 
-        "last_accessed": files_metadata[file_id].last_accessed.isoformat()
+        "status": "success",
+        "file_id": metadata.file_id,
+        "last_accessed": metadata.last_accessed
     }
 
+@app.get("/admin/files")
+async def get_files_metadata(ids: str):
+    """Get metadata for multiple files in one call.
+
+    ids is a comma-separated list of file ids; the response maps each id
+    to the same metadata shape as the single-file endpoint. The body is
+    assembled from the per-record serialized JSON caches, so a batch GET
+    costs one serialization per cold record and none per warm one.
+    """
+    entries = []
+    missing = []
+    for file_id in ids.split(","):
+        record = files_metadata.get(file_id)
+        if record is None:
+            missing.append(file_id)
+        else:
+            entries.append(orjson.dumps(file_id) + b":"
+                           + (record._json_cache or serialize_metadata(record)))
+    if missing:
+        raise HTTPException(status_code=404,
+                            detail=f"Files not found: {', '.join(missing)}")
+
+    return Response(content=b"{" + b",".join(entries) + b"}",
+                    media_type="application/json")
+
+@app.post("/admin/files/update-last-accessed/batch")
+async def bulk_update_last_accessed(updates: Dict[str, int]):
+    """Update last_accessed for many files in one request.
+
+    Accepts a mapping of file_id to days_ago, amortizing the HTTP and
+    framework overhead that per-file calls pay - test setup phases bump
+    dozens of timestamps at a time. All ids are validated before any
+    update is applied.
+    """
+    records = []
+    missing = []
+    for file_id, days_ago in updates.items():
+        metadata = files_metadata.get(file_id)
+        if metadata is None:
+            missing.append(file_id)
+        else:
+            records.append((metadata, days_ago))
+    if missing:
+        raise HTTPException(status_code=404,
+                            detail=f"Files not found: {', '.join(missing)}")
+
+    now = datetime.utcnow()
+    for metadata, days_ago in records:
+        metadata.last_accessed = now - timedelta(days=days_ago)
+        track_file_age(metadata)
+
+    return {"status": "success", "updated": len(updates)}
+
+@app.post("/admin/reset", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_storage():
+    """Reset all storage state (test support) - far cheaper than
+    rebuilding the app between tests."""
+    reset_storage_state()
+    return None
+
 @app.get("/admin/stats")
 async def get_stats():
-    """Get storage statistics."""
-    stats = {
+    """Get storage statistics from the running counters - O(1) per call."""
+    total_size = 0
+    tiers = {}
+    for ordinal, tier in enumerate(TIER_ORDER):
+        size = tier_sizes[ordinal]
+        total_size += size
+        tiers[tier] = {"count": tier_counts[ordinal], "size": size}
+
+    return {
         "total_files": len(files_metadata),
-        "total_size": sum(m.size for m in files_metadata.values()),
-        "tiers": {
-            tier: {"count": 0, "size": 0}
-            for tier in StorageTier
-        }
+        "total_size": total_size,
+        "tiers": tiers
     }
-    
-    for metadata in files_metadata.values():
-        stats["tiers"][metadata.tier]["count"] += 1
-        stats["tiers"][metadata.tier]["size"] += metadata.size
-    
-    return stats
 
 def start_service():
     """Start the storage service."""
@@ -0,0 +1,31 @@
+"""Fixtures for the functional tests."""
+import pytest
+
+
+@pytest.fixture(scope="module", autouse=True)
+def reset_storage(test_app):
+    """Module-scoped override of the suite-wide per-test reset.
+
+    Functional tests share one uploaded file (see uploaded_file_id), so
+    state is wiped once per module instead; each test otherwise touches
+    only ids it created itself.
+    """
+    test_app.post("/admin/reset")
+    yield
+    test_app.post("/admin/reset")
+
+
+@pytest.fixture(scope="module")
+def uploaded_file_id(test_app, sample_file):
+    """Upload sample_file once and share its id across read-only tests.
+
+    Saves the 19MB POST and server-side write that download/metadata
+    tests each used to repeat as their setup step. Tests that mutate the
+    file (delete) upload their own copy instead.
+    """
+    response = test_app.post("/files", files={
+        "file": (sample_file["filename"], sample_file["content"],
+                 sample_file["content_type"])
+    })
+    assert response.status_code == 201
+    return response.json()["file_id"]
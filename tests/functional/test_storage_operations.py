@@ -0,0 +1,69 @@
+"""Functional tests for the core storage operations."""
+
+
+def _upload(test_app, sample_file, filename=None):
+    return test_app.post("/files", files={
+        "file": (filename or sample_file["filename"], sample_file["content"],
+                 sample_file["content_type"])
+    })
+
+
+def test_upload_file(test_app, sample_file):
+    response = _upload(test_app, sample_file)
+    assert response.status_code == 201
+    data = response.json()
+    assert data["filename"] == sample_file["filename"]
+    assert data["size"] == sample_file["size"]
+    assert data["tier"] == "HOT"
+
+
+def test_download_file(test_app, sample_file, uploaded_file_id):
+    response = test_app.get(f"/files/{uploaded_file_id}")
+    assert response.status_code == 200
+    assert response.content == sample_file["content"]
+
+
+def test_get_metadata(test_app, sample_file, uploaded_file_id):
+    response = test_app.get(f"/files/{uploaded_file_id}/metadata")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["file_id"] == uploaded_file_id
+    assert data["filename"] == sample_file["filename"]
+
+
+def test_delete_file(test_app, sample_file):
+    # Function-scoped upload: this test consumes the file it creates.
+    # The 201 is the existence check - no need for a metadata GET first.
+    response = _upload(test_app, sample_file)
+    assert response.status_code == 201
+    file_id = response.json()["file_id"]
+
+    assert test_app.delete(f"/files/{file_id}").status_code == 204
+    assert test_app.get(f"/files/{file_id}/metadata").status_code == 404
+
+
+def test_tiering_multiple_files(test_app, sample_file):
+    test_cases = [(0, "HOT"), (45, "WARM"), (100, "COLD")]
+
+    file_ids = []
+    for i, (days_ago, _) in enumerate(test_cases):
+        response = _upload(test_app, sample_file, filename=f"tiering_case_{i}.txt")
+        assert response.status_code == 201
+        file_ids.append(response.json()["file_id"])
+
+    # One batch call ages all three files instead of a round-trip each
+    response = test_app.post("/admin/files/update-last-accessed/batch",
+                             json={file_id: days_ago
+                                   for file_id, (days_ago, _) in zip(file_ids, test_cases)})
+    assert response.status_code == 200
+
+    # Two runs: the 100-day-old file moves HOT->WARM then WARM->COLD
+    assert test_app.post("/admin/tiering/run").status_code == 200
+    assert test_app.post("/admin/tiering/run").status_code == 200
+
+    # One batched GET (and one JSON parse) covers all tier assertions
+    response = test_app.get("/admin/files?ids=" + ",".join(file_ids))
+    assert response.status_code == 200
+    data = response.json()
+    for file_id, (_, expected_tier) in zip(file_ids, test_cases):
+        assert data[file_id]["tier"] == expected_tier